@@ -165,7 +165,13 @@ def main():
         if args.topic:
             logging.info(f"Topic: {args.topic}")
 
-        gen.simulate(target_inclusive=target_files)
+        if llm is None:
+            # Offline generation is CPU-bound and threads are independent,
+            # so shard the work across cores. LLM runs stay serial: the
+            # client objects don't survive pickling and latency dominates.
+            gen.simulate_parallel(target_inclusive=target_files)
+        else:
+            gen.simulate(target_inclusive=target_files)
 
         logging.info(f"Generated {len(gen.emails)} emails.")
 
@@ -192,13 +198,16 @@ def main():
             inclusive_idx += 1
             logging.info(f"[{inclusive_idx}/{len(inclusive_emails)}] Processing email: {email_obj.subject}")
 
+            # Materialize the quoted chain once per saved email
+            body_text = gen.render_body(email_obj)
+
             # Generate attachment for this inclusive email based on percentage
             if random.random() < args.attachments / 100.0:
                 doc_types = ["report", "proposal", "notes", "analysis", "summary"]
                 doc_type = random.choice(doc_types)
                 logging.info(f"  Generating attachment (type: {doc_type})...")
                 filepath = gen.file_gen.generate_random_file(
-                    doc_type=doc_type, context=email_obj.body[:200]
+                    doc_type=doc_type, context=body_text[:200]
                 )
                 logging.info(f"  Attachment generated: {filepath}")
                 filename = os.path.basename(filepath)
@@ -213,7 +222,7 @@ def main():
                 all_attachments.add(att.filepath)
 
             md_path = save_as_markdown(
-                email_obj, gen.file_gen.output_dir, index=inclusive_idx
+                email_obj, gen.file_gen.output_dir, index=inclusive_idx, body=body_text
             )
 
             logging.info(f"Saved: {md_path}")
@@ -1,3 +1,4 @@
+import json
 import logging
 import os
 import random
@@ -9,63 +10,44 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-class GeminiGenerator:
-    def __init__(self, model_name: str = 'gemini-2.5-flash-lite') -> None:
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
-            raise ValueError("GEMINI_API_KEY not found in environment variables or .env file")
-        genai.configure(api_key=api_key)
-        # Some versions of the library expect 'models/' prefix, some don't.
-        # list_models() showed 'models/gemini-2.5-flash'
-        if not model_name.startswith('models/'):
-            model_name = f"models/{model_name}"
-        self.model = genai.GenerativeModel(model_name)
 
-    def generate_email_content(self, prompt: str) -> Optional[str]:
-        try:
-            logging.info(f"  [LLM] Requesting content from Gemini ({self.model.model_name})...")
-            response = self.model.generate_content(prompt)
-            if response and response.text:
-                logging.info("  [LLM] Done.")
-                return response.text
-            else:
-                logging.warning("  [LLM] Failed (Empty response).")
-                return None
-        except Exception as e:
-            logging.warning(f"  [LLM] Failed. Error generating content with Gemini: {e}")
-            return None
+def _split_subject_body(content: str) -> tuple[str, str]:
+    """Split LLM output of the form 'Subject: ...\\n\\n[Body]' into (subject, body).
 
-    def generate_email(
-        self,
-        sender: dict,
-        recipients: list[dict],
-        topic: Optional[str],
-        context: Optional[str] = None,
-        used_subjects: Optional[list[str]] = None,
-        is_forward: bool = False,
-    ) -> tuple[Optional[str], Optional[str]]:
-        styles = [
-            "direct and concise",
-            "formal and detailed",
-            "casual and friendly",
-            "slightly urgent",
-            "inquisitive",
-            "collaborative",
-            "apologetic but firm",
-            "enthusiastic"
-        ]
-        style = random.choice(styles)
-
-        topic_line = f"Topic: {topic}\n" if topic else ""
-        prompt = f"""
+    The prompt pins the Subject line to the top of the response, so only the
+    first line needs checking - no need to split and lowercase the whole body.
+    """
+    head, _, rest = content.lstrip().partition("\n")
+    if head[:8].lower() == "subject:":
+        return head[8:].strip(), rest.lstrip()
+    # No subject line found; treat everything as body and let the caller
+    # decide what to do with the generic subject.
+    return "No Subject", content
+
+
+_EMAIL_STYLES = (
+    "direct and concise",
+    "formal and detailed",
+    "casual and friendly",
+    "slightly urgent",
+    "inquisitive",
+    "collaborative",
+    "apologetic but firm",
+    "enthusiastic",
+)
+
+# Prompt fragments as module constants: building a prompt becomes one .format
+# per fragment plus a single join, instead of a chain of `prompt +=` copies.
+# Keeping the static text byte-identical across calls also helps provider-side
+# prompt prefix caches.
+_PROMPT_HEADER = """
         Generate a professional business email.
-        Sender: {sender['name']} ({sender['title']} in {sender['department']})
-        Recipients: {', '.join([r['name'] for r in recipients])}
+        Sender: {sender_name} ({sender_title} in {sender_department})
+        Recipients: {recipients}
         {topic_line}Style/Tone: {style}
         """
 
-        if context and is_forward:
-            prompt += f"""
+_PROMPT_FORWARD = """
 
             CONTEXT (Email being forwarded):
             {context}
@@ -76,8 +58,8 @@ class GeminiGenerator:
             3. Do NOT restate, summarize, or rewrite the forwarded email's content.
             4. Do NOT produce a Subject line; one will be set by the caller.
             """
-        elif context:
-            prompt += f"""
+
+_PROMPT_REPLY = """
 
             CONTEXT (Previous Email Thread):
             {context}
@@ -88,46 +70,141 @@ class GeminiGenerator:
             3. Do NOT repeat the full context or history. Write ONLY the new body text of your reply.
             4. Do NOT produce a Subject line; the thread's Re: subject will be set by the caller.
             """
-        else:
-            prompt += f"""
+
+_PROMPT_NEW = """
 
             INSTRUCTIONS:
             1. This is the start of a new email thread.
             2. Create a specific, interesting Subject line relevant to the topic (avoid generic titles like "Update" or "Hello").
             3. Write the body of the email initiating the discussion.
             """
-            if used_subjects:
-                prompt += f"""
+
+_PROMPT_SUBJECT_DEDUP = """
             4. IMPORTANT: Do NOT reuse or closely resemble any of these previously used subjects: {used_subjects}
                Each new thread MUST have a distinctly different subject line.
             """
 
-        prompt += "\n\nPlease provide the email in the following format:\nSubject: [Subject]\n\n[Body]"
+_PROMPT_TEXT_FORMAT = "\n\nPlease provide the email in the following format:\nSubject: [Subject]\n\n[Body]"
 
-        content = self.generate_email_content(prompt)
+
+def _build_email_prompt(
+    sender: dict,
+    recipients: list[dict],
+    topic: Optional[str],
+    style: str,
+    context: Optional[str] = None,
+    used_subjects: Optional[list[str]] = None,
+    is_forward: bool = False,
+) -> str:
+    """Assemble an email-generation prompt from the shared template fragments."""
+    parts = [
+        _PROMPT_HEADER.format(
+            sender_name=sender["name"],
+            sender_title=sender["title"],
+            sender_department=sender["department"],
+            recipients=", ".join(r["name"] for r in recipients),
+            topic_line=f"Topic: {topic}\n" if topic else "",
+            style=style,
+        )
+    ]
+    if context and is_forward:
+        parts.append(_PROMPT_FORWARD.format(context=context))
+    elif context:
+        parts.append(_PROMPT_REPLY.format(context=context))
+    else:
+        parts.append(_PROMPT_NEW)
+        if used_subjects:
+            parts.append(_PROMPT_SUBJECT_DEDUP.format(used_subjects=used_subjects))
+    return "".join(parts)
+
+
+# Shared Gemini state: genai.configure() and GenerativeModel() both do client
+# setup work, so configure once and reuse one model instance per model name
+# (and its underlying HTTP channel) across GeminiGenerator constructions.
+_GEMINI_CONFIGURED = False
+_GEMINI_MODELS: dict[str, "genai.GenerativeModel"] = {}
+
+# Structured-output config for email generation: forcing JSON with a fixed
+# schema makes parsing deterministic (no 'Subject:' line scraping, no retries
+# on malformed output) and skips the formatting boilerplate tokens.
+_EMAIL_GENERATION_CONFIG = {
+    "response_mime_type": "application/json",
+    "response_schema": {
+        "type": "object",
+        "properties": {
+            "subject": {"type": "string"},
+            "body": {"type": "string"},
+        },
+        "required": ["subject", "body"],
+    },
+}
+
+
+class GeminiGenerator:
+    def __init__(self, model_name: str = 'gemini-2.5-flash-lite') -> None:
+        global _GEMINI_CONFIGURED
+        if not _GEMINI_CONFIGURED:
+            api_key = os.getenv("GEMINI_API_KEY")
+            if not api_key:
+                raise ValueError("GEMINI_API_KEY not found in environment variables or .env file")
+            genai.configure(api_key=api_key)
+            _GEMINI_CONFIGURED = True
+        # Some versions of the library expect 'models/' prefix, some don't.
+        # list_models() showed 'models/gemini-2.5-flash'
+        if not model_name.startswith('models/'):
+            model_name = f"models/{model_name}"
+        model = _GEMINI_MODELS.get(model_name)
+        if model is None:
+            model = _GEMINI_MODELS[model_name] = genai.GenerativeModel(model_name)
+        self.model = model
+
+    def generate_email_content(self, prompt: str, generation_config: Optional[dict] = None) -> Optional[str]:
+        try:
+            logging.debug("  [LLM] Requesting content from Gemini (%s)...", self.model.model_name)
+            if generation_config:
+                response = self.model.generate_content(prompt, generation_config=generation_config)
+            else:
+                response = self.model.generate_content(prompt)
+            if response and response.text:
+                logging.debug("  [LLM] Done.")
+                return response.text
+            else:
+                logging.warning("  [LLM] Failed (Empty response).")
+                return None
+        except Exception as e:
+            logging.warning(f"  [LLM] Failed. Error generating content with Gemini: {e}")
+            return None
+
+    def generate_email(
+        self,
+        sender: dict,
+        recipients: list[dict],
+        topic: Optional[str],
+        context: Optional[str] = None,
+        used_subjects: Optional[list[str]] = None,
+        is_forward: bool = False,
+    ) -> tuple[Optional[str], Optional[str]]:
+        style = random.choice(_EMAIL_STYLES)
+        prompt = _build_email_prompt(
+            sender,
+            recipients,
+            topic,
+            style,
+            context=context,
+            used_subjects=used_subjects,
+            is_forward=is_forward,
+        )
+
+        content = self.generate_email_content(
+            prompt, generation_config=_EMAIL_GENERATION_CONFIG
+        )
         if content:
-            # Basic parsing of Subject and Body
-            lines = content.strip().split('\n')
-            subject = "No Subject"
-            body = content
-            
-            # Find subject line
-            subject_found = False
-            for i, line in enumerate(lines):
-                if line.lower().startswith("subject:"):
-                    subject = line[len("subject:"):].strip()
-                    # If it's a reply and the LLM generated a new subject, we might ignore it in the caller, 
-                    # but here we just return what we found.
-                    # The body is everything after this line
-                    body = '\n'.join(lines[i+1:]).strip()
-                    subject_found = True
-                    break
-            
-            if not subject_found:
-                # If no subject line found, assume all text is body and subject is generic (or handled by caller)
-                body = content
-                
-            return subject, body
+            try:
+                data = json.loads(content)
+                return data["subject"], data["body"]
+            except (ValueError, KeyError, TypeError):
+                # Model ignored JSON mode; fall back to the text splitter.
+                return _split_subject_body(content)
         return None, None
 
 
@@ -144,13 +221,13 @@ class OpenRouterGenerator:
 
     def generate_email_content(self, prompt: str) -> Optional[str]:
         try:
-            logging.info(f"  [LLM] Requesting content from OpenRouter ({self.model_name})...")
+            logging.debug("  [LLM] Requesting content from OpenRouter (%s)...", self.model_name)
             response = self.client.chat.completions.create(
                 model=self.model_name,
                 messages=[{"role": "user", "content": prompt}],
             )
             if response and response.choices and response.choices[0].message.content:
-                logging.info("  [LLM] Done.")
+                logging.debug("  [LLM] Done.")
                 return response.choices[0].message.content
             else:
                 logging.warning("  [LLM] Failed (Empty response).")
@@ -168,82 +245,18 @@ class OpenRouterGenerator:
         used_subjects: Optional[list[str]] = None,
         is_forward: bool = False,
     ) -> tuple[Optional[str], Optional[str]]:
-        styles = [
-            "direct and concise",
-            "formal and detailed",
-            "casual and friendly",
-            "slightly urgent",
-            "inquisitive",
-            "collaborative",
-            "apologetic but firm",
-            "enthusiastic"
-        ]
-        style = random.choice(styles)
-
-        topic_line = f"Topic: {topic}\n" if topic else ""
-        prompt = f"""
-        Generate a professional business email.
-        Sender: {sender['name']} ({sender['title']} in {sender['department']})
-        Recipients: {', '.join([r['name'] for r in recipients])}
-        {topic_line}Style/Tone: {style}
-        """
-
-        if context and is_forward:
-            prompt += f"""
-
-            CONTEXT (Email being forwarded):
-            {context}
-
-            INSTRUCTIONS:
-            1. You are forwarding the email above to a new recipient who was NOT part of the original thread.
-            2. Write 1-3 short sentences of forwarder commentary (e.g., "FYI", "thought you should see this", "can you weigh in?"). It should sound like a brief intro, not a reply.
-            3. Do NOT restate, summarize, or rewrite the forwarded email's content.
-            4. Do NOT produce a Subject line; one will be set by the caller.
-            """
-        elif context:
-            prompt += f"""
-
-            CONTEXT (Previous Email Thread):
-            {context}
-
-            INSTRUCTIONS:
-            1. You are replying to the email above.
-            2. Address specific points raised in the context.
-            3. Do NOT repeat the full context or history. Write ONLY the new body text of your reply.
-            4. Do NOT produce a Subject line; the thread's Re: subject will be set by the caller.
-            """
-        else:
-            prompt += f"""
-
-            INSTRUCTIONS:
-            1. This is the start of a new email thread.
-            2. Create a specific, interesting Subject line relevant to the topic (avoid generic titles like "Update" or "Hello").
-            3. Write the body of the email initiating the discussion.
-            """
-            if used_subjects:
-                prompt += f"""
-            4. IMPORTANT: Do NOT reuse or closely resemble any of these previously used subjects: {used_subjects}
-               Each new thread MUST have a distinctly different subject line.
-            """
-
-        prompt += "\n\nPlease provide the email in the following format:\nSubject: [Subject]\n\n[Body]"
+        style = random.choice(_EMAIL_STYLES)
+        prompt = _build_email_prompt(
+            sender,
+            recipients,
+            topic,
+            style,
+            context=context,
+            used_subjects=used_subjects,
+            is_forward=is_forward,
+        ) + _PROMPT_TEXT_FORMAT
 
         content = self.generate_email_content(prompt)
         if content:
-            lines = content.strip().split('\n')
-            subject = "No Subject"
-            body = content
-
-            subject_found = False
-            for i, line in enumerate(lines):
-                if line.lower().startswith("subject:"):
-                    subject = line[len("subject:"):].strip()
-                    body = '\n'.join(lines[i+1:]).strip()
-                    subject_found = True
-                    break
-
-            if not subject_found:
-                body = content
-
-            return subject, body
+            return _split_subject_body(content)
         return None, None
@@ -3,16 +3,40 @@ Email and Attachment data models.
 """
 
 import datetime
-import uuid
+import functools
+import itertools
+import os
+import sys
 from typing import Optional
 
 from faker_instance import fake
 
+_id_counter = itertools.count(1)
 
+
+def next_id() -> str:
+    """Return a cheap process-unique id for in-memory threading.
+
+    uuid4 pulls OS entropy and formats 36 characters per call, which is
+    overkill for identity that only has to be unique within a run. A
+    pid-qualified counter is enough, and stays collision-free when
+    simulate_parallel merges emails produced in worker processes.
+    """
+    return f"{os.getpid():x}.{next(_id_counter):x}"
+
+
+@functools.lru_cache(maxsize=4096)
 def parse_display(display: str) -> dict[str, str]:
     """
     Parse a display string like 'Name <email>' into a dict.
 
+    Results are memoized: the same small set of roster display strings is
+    parsed thousands of times across a simulation, so repeat calls become a
+    cache lookup. The returned dict is shared across callers: 'name' and
+    'email' must never be modified. ThreadGenerator.get_person_display may
+    memoize a derived '_display' entry onto it, which is safe because the
+    value is deterministic for a given dict.
+
     Args:
         display: String in format "Name <email@example.com>" or just "email@example.com"
 
@@ -29,8 +53,10 @@ def parse_display(display: str) -> dict[str, str]:
 class Attachment:
     """Represents an email attachment (PDF or DOCX)."""
 
+    __slots__ = ("id", "filename", "filepath", "content_type")
+
     def __init__(self, filename: str, filepath: str, content_type: str) -> None:
-        self.id: str = str(uuid.uuid4())
+        self.id: str = next_id()
         self.filename = filename
         self.filepath = filepath
         self.content_type = content_type
@@ -53,14 +79,41 @@ class Email:
         cc: List of CC recipient display strings
         bcc: List of BCC recipient display strings
         subject: Email subject line
-        body: Email body text
+        body: Email body text (None when new_text is used instead)
+        new_text: Just the new text of a reply/forward, without the quoted
+            chain; the full body is rendered lazily from the parent chain
         date: Datetime of the email
         type: Message type (new, reply, forward)
         in_reply_to: Parent message ID
-        references: List of ancestor message IDs
+        references: Tuple of ancestor message IDs
         attachments: List of Attachment objects
+
+    Instances use __slots__ to keep the per-email footprint small: large
+    corpora are held fully in memory before being written out, so the
+    per-instance __dict__ overhead adds up quickly. Sender/recipient display
+    strings are interned since the same small roster repeats across
+    thousands of emails.
     """
 
+    __slots__ = (
+        "id",
+        "message_id",
+        "thread_id",
+        "parent_id",
+        "sender",
+        "recipients",
+        "cc",
+        "bcc",
+        "subject",
+        "body",
+        "new_text",
+        "date",
+        "type",
+        "in_reply_to",
+        "references",
+        "attachments",
+    )
+
     def __init__(
         self,
         sender: str,
@@ -73,26 +126,30 @@ class Email:
         thread_id: Optional[str] = None,
         msg_type: str = "new",
     ) -> None:
-        self.id: str = str(uuid.uuid4())
+        self.id: str = next_id()
         self.message_id: str = (
             message_id if message_id else f"<{self.id}@{fake.free_email_domain()}>"
         )
-        self.thread_id: str = thread_id if thread_id else str(uuid.uuid4())
+        self.thread_id: str = thread_id if thread_id else next_id()
         self.parent_id: Optional[str] = parent_id
 
-        self.sender = sender
-        self.recipients = recipients
+        self.sender = sys.intern(sender)
+        self.recipients = [sys.intern(r) for r in recipients]
         self.cc: list[str] = []
         self.bcc: list[str] = []
 
         self.subject = subject
         self.body = body
+        self.new_text: Optional[str] = None
         self.date = date
 
         self.type = msg_type
 
         self.in_reply_to: Optional[str] = parent_id if parent_id else None
-        self.references: list[str] = []
+        # Stored as a tuple: reply chains extend it once per hop, and tuple
+        # concatenation is a single contiguous allocation with no spare
+        # capacity, unlike growing a fresh list per level.
+        self.references: tuple[str, ...] = ()
 
         self.attachments: list[Attachment] = []
 
@@ -2,137 +2,212 @@
 File generator for creating PDF and DOCX attachments.
 """
 
+from __future__ import annotations
+
+import gc
+import io
 import os
 import re
 import random
 from typing import Optional
 
-from docx import Document
-from docx.enum.section import WD_ORIENT
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml.ns import qn
-from docx.shared import Inches, Pt, RGBColor, Cm
 from pdf_utils import init_pdf
 from utils import sanitize_filename
 
 from faker_instance import fake
 
-STYLE_PROFILES = {
-    "corporate_classic": {
-        "body_font": "Calibri",
-        "heading_font": "Cambria",
-        "heading_color": RGBColor(0x1F, 0x3A, 0x5F),  # dark blue
-        "body_size": Pt(11),
-        "heading1_size": Pt(18),
-        "heading2_size": Pt(14),
-        "title_size": Pt(26),
-        "line_spacing": 1.15,
-        "space_after": Pt(8),
-        "margins": Cm(2.54),  # 1.0"
-        "table_style": "Medium Shading 1 Accent 1",
-        "header_type": "company",
-        "footer_type": "page_number",
-        "has_cover_page": True,
-        "heading_treatment": "bottom_border",
-        "body_shading": None,
-        "section_dividers": False,
-    },
-    "modern_minimal": {
-        "body_font": "Arial",
-        "heading_font": "Arial",
-        "heading_color": RGBColor(0x22, 0x22, 0x22),  # near-black
-        "body_size": Pt(10),
-        "heading1_size": Pt(16),
-        "heading2_size": Pt(13),
-        "title_size": Pt(24),
-        "line_spacing": 1.08,
-        "space_after": Pt(6),
-        "margins": Cm(1.91),  # 0.75"
-        "table_style": "Light List Accent 1",
-        "header_type": "none",
-        "footer_type": "both",
-        "has_cover_page": False,
-        "heading_treatment": "all_caps_bottom",
-        "body_shading": None,
-        "section_dividers": False,
-    },
-    "formal_report": {
-        "body_font": "Times New Roman",
-        "heading_font": "Georgia",
-        "heading_color": RGBColor(0x8B, 0x00, 0x00),  # dark red
-        "body_size": Pt(12),
-        "heading1_size": Pt(18),
-        "heading2_size": Pt(15),
-        "title_size": Pt(28),
-        "line_spacing": 1.5,
-        "space_after": Pt(10),
-        "margins": Cm(3.18),  # 1.25"
-        "table_style": "Medium Grid 1 Accent 2",
-        "header_type": "confidential",
-        "footer_type": "date",
-        "has_cover_page": True,
-        "heading_treatment": "underline",
-        "body_shading": None,
-        "section_dividers": True,
-    },
-    "tech_memo": {
-        "body_font": "Consolas",
-        "heading_font": "Calibri",
-        "heading_color": RGBColor(0x00, 0x70, 0xC0),  # bright blue
-        "body_size": Pt(10),
-        "heading1_size": Pt(16),
-        "heading2_size": Pt(13),
-        "title_size": Pt(22),
-        "line_spacing": 1.0,
-        "space_after": Pt(4),
-        "margins": Cm(2.03),  # 0.8"
-        "table_style": "Light Grid Accent 5",
-        "header_type": "draft",
-        "footer_type": "page_number",
-        "has_cover_page": False,
-        "heading_treatment": "left_accent",
-        "body_shading": "E8E8E8",
-        "section_dividers": False,
-    },
-    "executive_brief": {
-        "body_font": "Garamond",
-        "heading_font": "Garamond",
-        "heading_color": RGBColor(0x1B, 0x5E, 0x20),  # dark green
-        "body_size": Pt(12),
-        "heading1_size": Pt(20),
-        "heading2_size": Pt(16),
-        "title_size": Pt(30),
-        "line_spacing": 1.3,
-        "space_after": Pt(12),
-        "margins": Cm(3.81),  # 1.5"
-        "table_style": "Medium Shading 2 Accent 3",
-        "header_type": "company",
-        "footer_type": "both",
-        "has_cover_page": True,
-        "heading_treatment": "shaded_bg",
-        "body_shading": None,
-        "section_dividers": False,
-    },
-    "compact_dense": {
-        "body_font": "Verdana",
-        "heading_font": "Tahoma",
-        "heading_color": RGBColor(0x60, 0x60, 0x60),  # medium gray
-        "body_size": Pt(9),
-        "heading1_size": Pt(14),
-        "heading2_size": Pt(11),
-        "title_size": Pt(20),
-        "line_spacing": 1.0,
-        "space_after": Pt(3),
-        "margins": Cm(1.27),  # 0.5"
-        "table_style": "Light List Accent 3",
-        "header_type": "none",
-        "footer_type": "none",
-        "has_cover_page": False,
-        "heading_treatment": "box_border",
-        "body_shading": None,
-        "section_dividers": False,
-    },
-}
+# Bound Faker provider methods, resolved once. Every fake.X attribute access
+# walks Faker's provider-lookup proxy; table and content generation call these
+# dozens of times per document.
+_fake_bs = fake.bs
+_fake_catch_phrase = fake.catch_phrase
+_fake_company = fake.company
+_fake_company_email = fake.company_email
+_fake_date_between = fake.date_between
+_fake_date_this_year = fake.date_this_year
+_fake_job = fake.job
+_fake_name = fake.name
+_fake_paragraph = fake.paragraph
+_fake_sentence = fake.sentence
+
+# Markdown parsing patterns, compiled once. create_docx runs these per line of
+# every generated document, so going through re's module-level cache on each
+# call is measurable on content-heavy attachments.
+_TITLE_PREFIX_RE = re.compile(r"^\d{4}\s+")
+_NUMBERED_RE = re.compile(r"^\d+\.\s+", re.MULTILINE)
+_BOLD_SPLIT_RE = re.compile(r"(\*\*[^*]+\*\*)")
+
+# Single alternation matched once per line; dispatch on which named group hit
+# instead of probing each line with four separate startswith/match calls.
+# Group order matters: h3 must precede h2 must precede h1.
+_LINE_RE = re.compile(
+    r"^(?:(?P<h3>###\s+)|(?P<h2>##\s+)|(?P<h1>#\s+)|(?P<bullet>[-*]\s+)|(?P<num>\d+\.\s+))"
+)
+
+
+_TABLE_TYPES = ("budget", "status", "comparison", "contacts")
+_FILE_EXTENSIONS = ("pdf", "docx")
+
+# python-docx and the DOCX style constants are loaded lazily: importing docx
+# and constructing six profiles' worth of Pt/RGBColor/Cm objects is pure
+# startup cost for consumers that only ever render PDFs.
+_DOCX_LOADED = False
+
+
+def _ensure_docx() -> None:
+    """Import python-docx and build the DOCX style constants on first use."""
+    global _DOCX_LOADED
+    if _DOCX_LOADED:
+        return
+    global Document, WD_ORIENT, WD_ALIGN_PARAGRAPH, qn, Pt, RGBColor, Cm
+    global _DOCX_TEMPLATE, STYLE_PROFILES, _STYLE_PROFILE_NAMES
+    global _PT8, _PT9, _PT10, _GRAY, _LIGHT_GRAY, _RED
+
+    from docx import Document
+    from docx.enum.section import WD_ORIENT
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.oxml.ns import qn
+    from docx.shared import Pt, RGBColor, Cm
+
+    # python-docx unzips and parses its default.docx template on every bare
+    # Document() call. Build one pristine document, save it to memory, and
+    # reopen those bytes per generation - same amortization as reading the
+    # packaged template file, without depending on python-docx's internal
+    # file layout.
+    buf = io.BytesIO()
+    Document().save(buf)
+    _DOCX_TEMPLATE = buf.getvalue()
+
+    STYLE_PROFILES = {
+        "corporate_classic": {
+            "body_font": "Calibri",
+            "heading_font": "Cambria",
+            "heading_color": RGBColor(0x1F, 0x3A, 0x5F),  # dark blue
+            "body_size": Pt(11),
+            "heading1_size": Pt(18),
+            "heading2_size": Pt(14),
+            "title_size": Pt(26),
+            "line_spacing": 1.15,
+            "space_after": Pt(8),
+            "margins": Cm(2.54),  # 1.0"
+            "table_style": "Medium Shading 1 Accent 1",
+            "header_type": "company",
+            "footer_type": "page_number",
+            "has_cover_page": True,
+            "heading_treatment": "bottom_border",
+            "body_shading": None,
+            "section_dividers": False,
+        },
+        "modern_minimal": {
+            "body_font": "Arial",
+            "heading_font": "Arial",
+            "heading_color": RGBColor(0x22, 0x22, 0x22),  # near-black
+            "body_size": Pt(10),
+            "heading1_size": Pt(16),
+            "heading2_size": Pt(13),
+            "title_size": Pt(24),
+            "line_spacing": 1.08,
+            "space_after": Pt(6),
+            "margins": Cm(1.91),  # 0.75"
+            "table_style": "Light List Accent 1",
+            "header_type": "none",
+            "footer_type": "both",
+            "has_cover_page": False,
+            "heading_treatment": "all_caps_bottom",
+            "body_shading": None,
+            "section_dividers": False,
+        },
+        "formal_report": {
+            "body_font": "Times New Roman",
+            "heading_font": "Georgia",
+            "heading_color": RGBColor(0x8B, 0x00, 0x00),  # dark red
+            "body_size": Pt(12),
+            "heading1_size": Pt(18),
+            "heading2_size": Pt(15),
+            "title_size": Pt(28),
+            "line_spacing": 1.5,
+            "space_after": Pt(10),
+            "margins": Cm(3.18),  # 1.25"
+            "table_style": "Medium Grid 1 Accent 2",
+            "header_type": "confidential",
+            "footer_type": "date",
+            "has_cover_page": True,
+            "heading_treatment": "underline",
+            "body_shading": None,
+            "section_dividers": True,
+        },
+        "tech_memo": {
+            "body_font": "Consolas",
+            "heading_font": "Calibri",
+            "heading_color": RGBColor(0x00, 0x70, 0xC0),  # bright blue
+            "body_size": Pt(10),
+            "heading1_size": Pt(16),
+            "heading2_size": Pt(13),
+            "title_size": Pt(22),
+            "line_spacing": 1.0,
+            "space_after": Pt(4),
+            "margins": Cm(2.03),  # 0.8"
+            "table_style": "Light Grid Accent 5",
+            "header_type": "draft",
+            "footer_type": "page_number",
+            "has_cover_page": False,
+            "heading_treatment": "left_accent",
+            "body_shading": "E8E8E8",
+            "section_dividers": False,
+        },
+        "executive_brief": {
+            "body_font": "Garamond",
+            "heading_font": "Garamond",
+            "heading_color": RGBColor(0x1B, 0x5E, 0x20),  # dark green
+            "body_size": Pt(12),
+            "heading1_size": Pt(20),
+            "heading2_size": Pt(16),
+            "title_size": Pt(30),
+            "line_spacing": 1.3,
+            "space_after": Pt(12),
+            "margins": Cm(3.81),  # 1.5"
+            "table_style": "Medium Shading 2 Accent 3",
+            "header_type": "company",
+            "footer_type": "both",
+            "has_cover_page": True,
+            "heading_treatment": "shaded_bg",
+            "body_shading": None,
+            "section_dividers": False,
+        },
+        "compact_dense": {
+            "body_font": "Verdana",
+            "heading_font": "Tahoma",
+            "heading_color": RGBColor(0x60, 0x60, 0x60),  # medium gray
+            "body_size": Pt(9),
+            "heading1_size": Pt(14),
+            "heading2_size": Pt(11),
+            "title_size": Pt(20),
+            "line_spacing": 1.0,
+            "space_after": Pt(3),
+            "margins": Cm(1.27),  # 0.5"
+            "table_style": "Light List Accent 3",
+            "header_type": "none",
+            "footer_type": "none",
+            "has_cover_page": False,
+            "heading_treatment": "box_border",
+            "body_shading": None,
+            "section_dividers": False,
+        },
+    }
+
+    _STYLE_PROFILE_NAMES = tuple(STYLE_PROFILES)
+
+    # Font sizes and colors used by headers, footers, and cover pages, built
+    # once instead of constructing fresh Pt/RGBColor objects per document.
+    _PT8 = Pt(8)
+    _PT9 = Pt(9)
+    _PT10 = Pt(10)
+    _GRAY = RGBColor(0x66, 0x66, 0x66)
+    _LIGHT_GRAY = RGBColor(0x99, 0x99, 0x99)
+    _RED = RGBColor(0xCC, 0x00, 0x00)
+
+    _DOCX_LOADED = True
+
 
 
 class FileGenerator:
@@ -142,7 +217,13 @@ class FileGenerator:
     Uses LLM for content generation when available, with faker-based
     fallbacks for offline operation.
     """
-    
+
+    # lxml document trees sit in reference cycles that the refcounter cannot
+    # reclaim, so RSS creeps up across long batch runs until the cyclic GC
+    # happens to fire. Collecting right after each save bounds peak memory;
+    # single-shot users can set this to False to skip the ~ms collection cost.
+    _gc_after_save = True
+
     def __init__(self, output_dir: str = "output", llm: Optional[object] = None, topic: Optional[str] = None) -> None:
         self.output_dir = output_dir
         self.llm = llm
@@ -152,41 +233,50 @@ class FileGenerator:
 
     def create_pdf(self, filename: str, content_text: str) -> str:
         """Create a PDF file with the given content."""
-        pdf = init_pdf()
+        # Only the regular face is used below; skipping the B/I/BI
+        # registrations avoids three redundant TTF parses per document.
+        pdf = init_pdf(styles=("",))
         pdf.add_page()
         pdf.set_font("DejaVu", size=12)
         pdf.multi_cell(0, 10, txt=content_text)
 
         filepath = os.path.join(self.output_dir, filename)
         pdf.output(filepath)
+        if self._gc_after_save:
+            pdf = None
+            gc.collect()
         return filepath
 
     def create_docx(self, filename: str, content_text: str) -> str:
         """Create a DOCX file with rich formatting parsed from markdown."""
-        doc = Document()
+        _ensure_docx()
+        doc = Document(io.BytesIO(_DOCX_TEMPLATE))
 
         # Pick a random style profile
-        profile_name = random.choice(list(STYLE_PROFILES.keys()))
+        profile_name = random.choice(_STYLE_PROFILE_NAMES)
         profile = STYLE_PROFILES[profile_name]
 
+        # Resolve the section wrapper once and thread it through the helpers
+        # instead of each one re-walking doc.sections[0]
+        section = doc.sections[0]
+
         # Apply style profile (fonts, colors, margins, spacing)
-        self._apply_style_profile(doc, profile)
+        self._apply_style_profile(doc, profile, section)
 
         # 25% chance of landscape orientation
         if random.random() < 0.25:
-            section = doc.sections[0]
+            # Read both dimensions once before swapping - every page_* access
+            # goes through a descriptor that parses the section XML
+            w, h = section.page_width, section.page_height
             section.orientation = WD_ORIENT.LANDSCAPE
-            # Swap width and height for landscape
-            new_width, new_height = section.page_height, section.page_width
-            section.page_width = new_width
-            section.page_height = new_height
+            section.page_width, section.page_height = h, w
 
         # Add header/footer per profile
-        self._add_header_footer(doc, profile)
+        self._add_header_footer(section, profile)
 
         # Derive title text from filename
         title_text = filename.replace(".docx", "").replace("_", " ")
-        title_text = re.sub(r"^\d{4}\s+", "", title_text)
+        title_text = _TITLE_PREFIX_RE.sub("", title_text)
 
         # Add cover page if profile uses one
         if profile.get("has_cover_page"):
@@ -198,57 +288,80 @@ class FileGenerator:
         body_shading = profile.get("body_shading")
         section_dividers = profile.get("section_dividers", False)
 
-        lines = content_text.split("\n")
-        for line in lines:
-            stripped = line.strip()
-            if not stripped:
-                continue
-
-            # Headings: ## or ###
-            if stripped.startswith("### "):
-                heading = doc.add_heading(stripped[4:].strip("# "), level=2)
-                self._apply_heading_treatment(heading, profile, profile_name, 2)
-            elif stripped.startswith("## "):
-                # Add section divider before H1 if enabled (not before the first one)
-                if section_dividers and len(doc.paragraphs) > 1:
-                    self._add_section_divider(doc, profile)
-                heading = doc.add_heading(stripped[3:].strip("# "), level=1)
-                self._apply_heading_treatment(heading, profile, profile_name, 1)
-            elif stripped.startswith("# "):
-                if section_dividers and len(doc.paragraphs) > 1:
-                    self._add_section_divider(doc, profile)
-                heading = doc.add_heading(stripped[2:].strip("# "), level=1)
-                self._apply_heading_treatment(heading, profile, profile_name, 1)
-            # Bullet list: - item or * item
-            elif re.match(r"^[-*]\s+", stripped):
-                text = re.sub(r"^[-*]\s+", "", stripped)
-                para = doc.add_paragraph(style="List Bullet")
-                self._add_runs_with_bold(para, text)
-                if body_shading:
-                    self._add_paragraph_shading(para, body_shading)
-            # Numbered list: 1. item
-            elif re.match(r"^\d+\.\s+", stripped):
-                text = re.sub(r"^\d+\.\s+", "", stripped)
-                para = doc.add_paragraph(style="List Number")
-                self._add_runs_with_bold(para, text)
-                if body_shading:
-                    self._add_paragraph_shading(para, body_shading)
-            else:
-                para = doc.add_paragraph()
-                self._add_runs_with_bold(para, stripped)
-                if body_shading:
-                    self._add_paragraph_shading(para, body_shading)
-
-        # Maybe add a data table
-        self._maybe_add_table(doc, profile)
+        # Content with no markdown sentinels at all can skip the per-line
+        # dispatcher: a cheap substring scan decides once per document.
+        has_markdown = (
+            "#" in content_text
+            or "*" in content_text
+            or "-" in content_text
+            or _NUMBERED_RE.search(content_text) is not None
+        )
+        if not has_markdown:
+            for line in content_text.splitlines():
+                stripped = line.strip()
+                if stripped:
+                    para = doc.add_paragraph(stripped)
+                    if body_shading:
+                        self._add_paragraph_shading(para, body_shading)
+        else:
+            for line in content_text.splitlines():
+                stripped = line.strip()
+                if not stripped:
+                    continue
+
+                m = _LINE_RE.match(stripped)
+                kind = m.lastgroup if m else None
+
+                # Headings: #, ## (level 1) or ### (level 2)
+                if kind == "h3":
+                    heading = doc.add_heading(stripped[m.end():].strip("# "), level=2)
+                    self._apply_heading_treatment(heading, profile, profile_name, 2)
+                elif kind in ("h2", "h1"):
+                    # Add section divider before H1 if enabled (not before the first one)
+                    if section_dividers and len(doc.paragraphs) > 1:
+                        self._add_section_divider(doc, profile)
+                    heading = doc.add_heading(stripped[m.end():].strip("# "), level=1)
+                    self._apply_heading_treatment(heading, profile, profile_name, 1)
+                # Bullet list: - item or * item
+                elif kind == "bullet":
+                    text = stripped[m.end():]
+                    para = doc.add_paragraph(style="List Bullet")
+                    self._add_runs_with_bold(para, text)
+                    if body_shading:
+                        self._add_paragraph_shading(para, body_shading)
+                # Numbered list: 1. item
+                elif kind == "num":
+                    text = stripped[m.end():]
+                    para = doc.add_paragraph(style="List Number")
+                    self._add_runs_with_bold(para, text)
+                    if body_shading:
+                        self._add_paragraph_shading(para, body_shading)
+                else:
+                    para = doc.add_paragraph()
+                    self._add_runs_with_bold(para, stripped)
+                    if body_shading:
+                        self._add_paragraph_shading(para, body_shading)
+
+        # Maybe add a data table. The dice is rolled here so the decision is
+        # made before any table work starts, and content that already carries
+        # a markdown table (pipe rows) is never doubled up with a random one.
+        if random.random() <= 0.38 and "|" not in content_text:
+            self._add_table(doc, profile)
 
         filepath = os.path.join(self.output_dir, filename)
         doc.save(filepath)
+        if self._gc_after_save:
+            doc = None
+            gc.collect()
         return filepath
 
     def _add_runs_with_bold(self, paragraph: object, text: str) -> None:
         """Parse **bold** markers in text and add runs to paragraph."""
-        parts = re.split(r"(\*\*[^*]+\*\*)", text)
+        # Most lines carry no bold markers; skip the regex split entirely.
+        if "**" not in text:
+            paragraph.add_run(text)
+            return
+        parts = _BOLD_SPLIT_RE.split(text)
         for part in parts:
             if part.startswith("**") and part.endswith("**"):
                 run = paragraph.add_run(part[2:-2])
@@ -313,16 +426,16 @@ class FileGenerator:
 
             p_company = doc.add_paragraph()
             p_company.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            run = p_company.add_run(fake.company())
+            run = p_company.add_run(_fake_company())
             run.font.size = Pt(14)
             run.font.name = profile["heading_font"]
-            run.font.color.rgb = RGBColor(0x66, 0x66, 0x66)
+            run.font.color.rgb = _GRAY
 
             p_date = doc.add_paragraph()
             p_date.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            run = p_date.add_run(fake.date_this_year().strftime("%B %d, %Y"))
+            run = p_date.add_run(_fake_date_this_year().strftime("%B %d, %Y"))
             run.font.size = Pt(12)
-            run.font.color.rgb = RGBColor(0x99, 0x99, 0x99)
+            run.font.color.rgb = _LIGHT_GRAY
 
         elif profile_name == "formal_report":
             # Centered, large title — CONFIDENTIAL header is already in the header
@@ -340,10 +453,10 @@ class FileGenerator:
 
             p_sub = doc.add_paragraph()
             p_sub.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            run = p_sub.add_run(fake.date_this_year().strftime("%B %Y"))
+            run = p_sub.add_run(_fake_date_this_year().strftime("%B %Y"))
             run.font.size = Pt(14)
             run.font.name = profile["heading_font"]
-            run.font.color.rgb = RGBColor(0x66, 0x66, 0x66)
+            run.font.color.rgb = _GRAY
 
         elif profile_name == "executive_brief":
             # Elegant — title + subtitle only, large font
@@ -361,7 +474,7 @@ class FileGenerator:
             run = p_sub.add_run("Executive Brief")
             run.font.size = Pt(16)
             run.font.name = profile["heading_font"]
-            run.font.color.rgb = RGBColor(0x99, 0x99, 0x99)
+            run.font.color.rgb = _LIGHT_GRAY
             run.italic = True
 
         # Page break after cover page
@@ -410,7 +523,7 @@ class FileGenerator:
                 paragraph, ["top", "bottom", "left", "right"], "999999", "4", "2"
             )
 
-    def _apply_style_profile(self, doc: Document, profile: dict) -> None:
+    def _apply_style_profile(self, doc: Document, profile: dict, section) -> None:
         """Apply a visual style profile to the document (fonts, colors, margins, spacing)."""
         style_normal = doc.styles["Normal"]
         style_normal.font.name = profile["body_font"]
@@ -425,17 +538,14 @@ class FileGenerator:
             style.font.size = profile[size_key]
             style.font.color.rgb = profile["heading_color"]
 
-        section = doc.sections[0]
         m = profile["margins"]
         section.top_margin = m
         section.bottom_margin = m
         section.left_margin = m
         section.right_margin = m
 
-    def _add_header_footer(self, doc: Document, profile: dict) -> None:
-        """Add header and/or footer to the document based on the profile."""
-        section = doc.sections[0]
-
+    def _add_header_footer(self, section, profile: dict) -> None:
+        """Add header and/or footer to the given section based on the profile."""
         # Header
         header_type = profile["header_type"]
         if header_type != "none":
@@ -443,25 +553,25 @@ class FileGenerator:
             header.is_linked_to_previous = False
             p = header.paragraphs[0]
             if header_type == "company":
-                p.text = fake.company()
+                p.text = _fake_company()
                 p.alignment = WD_ALIGN_PARAGRAPH.RIGHT
                 for run in p.runs:
-                    run.font.size = Pt(9)
-                    run.font.color.rgb = RGBColor(0x66, 0x66, 0x66)
+                    run.font.size = _PT9
+                    run.font.color.rgb = _GRAY
             elif header_type == "confidential":
                 p.text = "CONFIDENTIAL"
                 p.alignment = WD_ALIGN_PARAGRAPH.CENTER
                 for run in p.runs:
-                    run.font.size = Pt(10)
+                    run.font.size = _PT10
                     run.font.bold = True
-                    run.font.color.rgb = RGBColor(0xCC, 0x00, 0x00)
+                    run.font.color.rgb = _RED
             elif header_type == "draft":
                 p.text = "DRAFT"
                 p.alignment = WD_ALIGN_PARAGRAPH.CENTER
                 for run in p.runs:
-                    run.font.size = Pt(10)
+                    run.font.size = _PT10
                     run.font.bold = True
-                    run.font.color.rgb = RGBColor(0x99, 0x99, 0x99)
+                    run.font.color.rgb = _LIGHT_GRAY
 
         # Footer
         footer_type = profile["footer_type"]
@@ -473,95 +583,93 @@ class FileGenerator:
                 p.alignment = WD_ALIGN_PARAGRAPH.CENTER
                 self._add_page_number_field(p, profile)
             elif footer_type == "date":
-                p.text = fake.date_this_year().strftime("%B %d, %Y")
+                p.text = _fake_date_this_year().strftime("%B %d, %Y")
                 p.alignment = WD_ALIGN_PARAGRAPH.CENTER
                 for run in p.runs:
-                    run.font.size = Pt(8)
-                    run.font.color.rgb = RGBColor(0x66, 0x66, 0x66)
+                    run.font.size = _PT8
+                    run.font.color.rgb = _GRAY
             elif footer_type == "both":
-                p.text = fake.date_this_year().strftime("%B %d, %Y")
+                p.text = _fake_date_this_year().strftime("%B %d, %Y")
                 p.alignment = WD_ALIGN_PARAGRAPH.LEFT
                 for run in p.runs:
-                    run.font.size = Pt(8)
-                    run.font.color.rgb = RGBColor(0x66, 0x66, 0x66)
+                    run.font.size = _PT8
+                    run.font.color.rgb = _GRAY
                 # Add right-aligned tab stop with page number
                 run_sep = p.add_run("\t\t")
-                run_sep.font.size = Pt(8)
+                run_sep.font.size = _PT8
                 self._add_page_number_field(p, profile)
 
     def _add_page_number_field(self, paragraph, profile: dict) -> None:
         """Insert a PAGE field code into the paragraph for automatic page numbering."""
+        # fldChar begin, instrText, and fldChar end are all run content, so a
+        # single <w:r> (with one font setup) carries the whole field instead
+        # of three separate runs.
         run = paragraph.add_run()
-        run.font.size = Pt(8)
-        run.font.color.rgb = RGBColor(0x66, 0x66, 0x66)
-        fldChar_begin = run._element.makeelement(qn("w:fldChar"), {qn("w:fldCharType"): "begin"})
-        run._element.append(fldChar_begin)
-
-        run2 = paragraph.add_run()
-        run2.font.size = Pt(8)
-        instrText = run2._element.makeelement(qn("w:instrText"), {})
+        run.font.size = _PT8
+        run.font.color.rgb = _GRAY
+        el = run._element
+        fldChar_begin = el.makeelement(qn("w:fldChar"), {qn("w:fldCharType"): "begin"})
+        instrText = el.makeelement(qn("w:instrText"), {})
         instrText.text = " PAGE "
-        run2._element.append(instrText)
-
-        run3 = paragraph.add_run()
-        run3.font.size = Pt(8)
-        fldChar_end = run3._element.makeelement(qn("w:fldChar"), {qn("w:fldCharType"): "end"})
-        run3._element.append(fldChar_end)
-
-    def _maybe_add_table(self, doc: Document, profile: dict) -> None:
-        """With ~38% probability, append a data table to the document."""
-        if random.random() > 0.38:
-            return
-
-        table_type = random.choice(["budget", "status", "comparison", "contacts"])
-
+        fldChar_end = el.makeelement(qn("w:fldChar"), {qn("w:fldCharType"): "end"})
+        el.append(fldChar_begin)
+        el.append(instrText)
+        el.append(fldChar_end)
+
+    def _add_table(self, doc: Document, profile: dict) -> None:
+        """Append a random data table to the document."""
+        table_type = random.choice(_TABLE_TYPES)
+
+        # Row data is generated column-wise in bulk and zipped back into rows,
+        # which keeps the per-cell work inside comprehensions instead of
+        # append loops.
         if table_type == "budget":
             doc.add_heading("Budget Summary", level=2)
             headers = ["Category", "Q1", "Q2", "Q3", "Q4"]
-            rows = []
-            for _ in range(random.randint(4, 7)):
-                rows.append([
-                    fake.bs().title(),
-                    f"${random.randint(10, 500):,},000",
-                    f"${random.randint(10, 500):,},000",
-                    f"${random.randint(10, 500):,},000",
-                    f"${random.randint(10, 500):,},000",
-                ])
+            n = random.randint(4, 7)
+            categories = [_fake_bs().title() for _ in range(n)]
+            quarters = [
+                [f"${random.randint(10, 500):,},000" for _ in range(n)]
+                for _ in range(4)
+            ]
+            rows = list(zip(categories, *quarters))
         elif table_type == "status":
             doc.add_heading("Project Status", level=2)
             headers = ["Task", "Owner", "Status", "Due Date"]
             statuses = ["Complete", "In Progress", "Not Started", "On Hold", "At Risk"]
-            rows = []
-            for _ in range(random.randint(5, 8)):
-                rows.append([
-                    fake.catch_phrase(),
-                    fake.name(),
-                    random.choice(statuses),
-                    fake.date_between(start_date="+1d", end_date="+90d").strftime("%Y-%m-%d"),
-                ])
+            n = random.randint(5, 8)
+            rows = list(zip(
+                [_fake_catch_phrase() for _ in range(n)],
+                [_fake_name() for _ in range(n)],
+                random.choices(statuses, k=n),
+                [
+                    _fake_date_between(start_date="+1d", end_date="+90d").strftime("%Y-%m-%d")
+                    for _ in range(n)
+                ],
+            ))
         elif table_type == "comparison":
             doc.add_heading("Feature Comparison", level=2)
             headers = ["Feature", "Option A", "Option B", "Option C"]
-            rows = []
-            for _ in range(random.randint(5, 8)):
-                rows.append([
-                    fake.catch_phrase(),
-                    random.choice(["Yes", "No", "Partial", "N/A"]),
-                    random.choice(["Yes", "No", "Partial", "N/A"]),
-                    random.choice(["Yes", "No", "Partial", "N/A"]),
-                ])
+            options = ["Yes", "No", "Partial", "N/A"]
+            n = random.randint(5, 8)
+            picks = random.choices(options, k=3 * n)
+            rows = list(zip(
+                [_fake_catch_phrase() for _ in range(n)],
+                picks[:n],
+                picks[n:2 * n],
+                picks[2 * n:],
+            ))
         else:  # contacts
             doc.add_heading("Contact Directory", level=2)
             headers = ["Name", "Role", "Department", "Email"]
             departments = ["Engineering", "Sales", "Marketing", "Finance", "HR", "Operations", "Legal"]
-            rows = []
-            for _ in range(random.randint(4, 7)):
-                rows.append([
-                    fake.name(),
-                    fake.job(),
-                    random.choice(departments),
-                    fake.company_email(),
-                ])
+            n = random.randint(4, 7)
+            rows = list(zip(
+                [_fake_name() for _ in range(n)],
+                [_fake_job() for _ in range(n)],
+                random.choices(departments, k=n),
+                [_fake_company_email() for _ in range(n)],
+            ))
 
         # Build the table
         table = doc.add_table(rows=1 + len(rows), cols=len(headers))
@@ -570,13 +678,31 @@ class FileGenerator:
         except KeyError:
             table.style = "Table Grid"
 
+        # Walk the row/cell wrappers once instead of re-indexing table.rows
+        # (which rebuilds proxy objects) for every single cell.
+        table_rows = list(table.rows)
         # Header row
-        for i, h in enumerate(headers):
-            table.rows[0].cells[i].text = h
+        for cell, h in zip(table_rows[0].cells, headers):
+            self._set_cell_text(cell, h)
         # Data rows
-        for r_idx, row_data in enumerate(rows):
-            for c_idx, cell_val in enumerate(row_data):
-                table.rows[r_idx + 1].cells[c_idx].text = cell_val
+        for row, row_data in zip(table_rows[1:], rows):
+            for cell, cell_val in zip(row.cells, row_data):
+                self._set_cell_text(cell, cell_val)
+
+    @staticmethod
+    def _set_cell_text(cell, text: str) -> None:
+        """Write text into a freshly created table cell via its XML.
+
+        The _Cell.text setter clears the cell's content and rebuilds a
+        paragraph on every assignment. Cells from add_table already hold one
+        empty <w:p>, so appending a single run to it is sufficient and skips
+        the clear/rebuild churn.
+        """
+        tc = cell._tc
+        p = tc.find(qn("w:p"))
+        if p is None:
+            p = tc.add_p()
+        p.add_r().text = text
 
     def _generate_content(self, doc_type: str, context: Optional[str] = None) -> str:
         """Generate document content using LLM or fallback templates."""
@@ -611,44 +737,44 @@ Keep it under 750 words. Write ONLY the document content."""
         # Fallback to topic-based template with markdown structure
         if self.topic:
             templates = [
-                f"## Overview\n\n{fake.paragraph(nb_sentences=4)}\n\n"
+                f"## Overview\n\n{_fake_paragraph(nb_sentences=4)}\n\n"
                 f"## Key Points\n\n"
-                f"- {fake.sentence()}\n- {fake.sentence()}\n- {fake.sentence()}\n\n"
-                f"## Details\n\n{fake.paragraph(nb_sentences=6)}",
+                f"- {_fake_sentence()}\n- {_fake_sentence()}\n- {_fake_sentence()}\n\n"
+                f"## Details\n\n{_fake_paragraph(nb_sentences=6)}",
 
-                f"## Executive Summary\n\n{fake.paragraph(nb_sentences=5)}\n\n"
-                f"## Analysis of {self.topic}\n\n{fake.paragraph(nb_sentences=4)}\n\n"
+                f"## Executive Summary\n\n{_fake_paragraph(nb_sentences=5)}\n\n"
+                f"## Analysis of {self.topic}\n\n{_fake_paragraph(nb_sentences=4)}\n\n"
                 f"### Findings\n\n"
-                f"1. {fake.sentence()}\n2. {fake.sentence()}\n3. {fake.sentence()}\n\n"
-                f"## Conclusion\n\n{fake.paragraph(nb_sentences=3)}",
+                f"1. {_fake_sentence()}\n2. {_fake_sentence()}\n3. {_fake_sentence()}\n\n"
+                f"## Conclusion\n\n{_fake_paragraph(nb_sentences=3)}",
 
                 f"## {self.topic} Discussion Notes\n\n"
-                f"**Attendees:** {fake.name()}, {fake.name()}, {fake.name()}\n\n"
+                f"**Attendees:** {_fake_name()}, {_fake_name()}, {_fake_name()}\n\n"
                 f"### Agenda Items\n\n"
-                f"- {fake.sentence()}\n- {fake.sentence()}\n\n"
+                f"- {_fake_sentence()}\n- {_fake_sentence()}\n\n"
                 f"### Action Items\n\n"
-                f"1. {fake.sentence()}\n2. {fake.sentence()}\n\n"
-                f"## Summary\n\n{fake.paragraph(nb_sentences=4)}",
+                f"1. {_fake_sentence()}\n2. {_fake_sentence()}\n\n"
+                f"## Summary\n\n{_fake_paragraph(nb_sentences=4)}",
 
                 f"## Proposal: {self.topic}\n\n"
-                f"### Background\n\n{fake.paragraph(nb_sentences=4)}\n\n"
+                f"### Background\n\n{_fake_paragraph(nb_sentences=4)}\n\n"
                 f"### Recommendations\n\n"
-                f"- **Option A:** {fake.sentence()}\n"
-                f"- **Option B:** {fake.sentence()}\n\n"
-                f"### Next Steps\n\n{fake.paragraph(nb_sentences=3)}",
+                f"- **Option A:** {_fake_sentence()}\n"
+                f"- **Option B:** {_fake_sentence()}\n\n"
+                f"### Next Steps\n\n{_fake_paragraph(nb_sentences=3)}",
             ]
             return random.choice(templates)
 
         # Structured fallback instead of random faker text
         return (
             f"## Business Document\n\n"
-            f"{fake.paragraph(nb_sentences=4)}\n\n"
+            f"{_fake_paragraph(nb_sentences=4)}\n\n"
             f"## Key Points\n\n"
-            f"- {fake.sentence()}\n"
-            f"- {fake.sentence()}\n"
-            f"- {fake.sentence()}\n\n"
+            f"- {_fake_sentence()}\n"
+            f"- {_fake_sentence()}\n"
+            f"- {_fake_sentence()}\n\n"
             f"## Summary\n\n"
-            f"{fake.paragraph(nb_sentences=3)}"
+            f"{_fake_paragraph(nb_sentences=3)}"
         )
 
     def _generate_document_title(self, doc_type: str, context: Optional[str] = None) -> str:
@@ -664,10 +790,13 @@ Rules:
 Return ONLY the filename, nothing else."""
             title = self.llm.generate_email_content(prompt)
             if title:
-                # Clean up any extra whitespace or quotes
-                title = title.strip().strip('"').strip("'").strip()
+                # Clean up any extra whitespace or quotes - one strip with the
+                # full character set instead of four chained passes
+                title = title.strip(" \t\n\r\"'")
                 # Ensure proper formatting
-                title = "_".join(word.capitalize() for word in title.replace("_", " ").split())
+                if "_" in title:
+                    title = title.replace("_", " ")
+                title = "_".join(word.capitalize() for word in title.split())
                 title = sanitize_filename(title)
                 if title:
                     return title
@@ -684,15 +813,99 @@ Return ONLY the filename, nothing else."""
         # Ultimate fallback
         return f"Business_{doc_type.capitalize()}"
 
+    def _unique_filename(self, filename: str, taken: set[str] | frozenset = frozenset()) -> str:
+        """Return filename, numbered if needed so it names a fresh file.
+
+        The fallback document titles are deterministic per (topic, doc_type),
+        so repeat generations would otherwise truncate-rewrite the same path
+        - and retroactively rewrite every hardlink save_as_markdown has
+        already taken of it. `taken` lets batch callers also avoid reusing a
+        name they have handed out but not yet rendered.
+        """
+        candidate = filename
+        base, ext = os.path.splitext(filename)
+        n = 1
+        while candidate in taken or os.path.exists(
+            os.path.join(self.output_dir, candidate)
+        ):
+            n += 1
+            candidate = f"{base}_{n}{ext}"
+        return candidate
+
     def generate_random_file(self, doc_type: str = "document", context: Optional[str] = None) -> str:
         """Generate a random PDF or DOCX file with LLM or fallback content."""
-        ext = random.choice(["pdf", "docx"])
+        ext = random.choice(_FILE_EXTENSIONS)
         # Generate a clean, professional document title
         doc_title = self._generate_document_title(doc_type, context)
-        filename = f"{doc_title}.{ext}"
+        filename = self._unique_filename(f"{doc_title}.{ext}")
         content = self._generate_content(doc_type, context)
 
         if ext == "pdf":
             return self.create_pdf(filename, content)
         else:
             return self.create_docx(filename, content)
+
+    def generate_many(
+        self,
+        count: int,
+        doc_type: str = "document",
+        context: Optional[str] = None,
+        max_workers: Optional[int] = None,
+    ) -> list[str]:
+        """Generate several random files, rendering them in parallel.
+
+        Titles and content are produced up front in this process - LLM
+        clients aren't fork-safe, so they never cross into the workers - and
+        only the CPU-bound docx/fpdf rendering fans out to a process pool.
+        Documents are independent, so throughput scales with core count.
+
+        Returns:
+            Filepaths in submission order.
+        """
+        jobs = []
+        taken: set[str] = set()
+        for _ in range(count):
+            ext = random.choice(_FILE_EXTENSIONS)
+            filename = self._unique_filename(
+                f"{self._generate_document_title(doc_type, context)}.{ext}",
+                taken=taken,
+            )
+            taken.add(filename)
+            # Forked workers inherit this process's RNG state, so each job
+            # carries its own seed - otherwise distinct jobs would render
+            # identical style profiles and table contents.
+            jobs.append((
+                filename,
+                self._generate_content(doc_type, context),
+                random.randrange(2**32),
+            ))
+
+        if count <= 1:
+            # Render inline without touching the seeds; reseeding here would
+            # clobber this process's RNG state.
+            return [
+                self.create_pdf(filename, content)
+                if filename.endswith(".pdf")
+                else self.create_docx(filename, content)
+                for filename, content, _ in jobs
+            ]
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        workers = max_workers or min(count, os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_render_file_worker, self.output_dir, filename, content, seed)
+                for filename, content, seed in jobs
+            ]
+            return [f.result() for f in futures]
+
+
+def _render_file_worker(output_dir: str, filename: str, content: str, seed: int) -> str:
+    """Render a single attachment; runs in worker processes for generate_many."""
+    random.seed(seed)
+    fake.seed_instance(seed)
+    gen = FileGenerator(output_dir)
+    if filename.endswith(".pdf"):
+        return gen.create_pdf(filename, content)
+    return gen.create_docx(filename, content)
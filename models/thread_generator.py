@@ -2,14 +2,14 @@
 Thread generator for simulating realistic email threads.
 """
 
+import concurrent.futures
 import os
 import random
 import datetime
 import logging
-import uuid
 from typing import Optional
 
-from .email import Email, Attachment, parse_display
+from .email import Email, Attachment, next_id, parse_display
 from .file_generator import FileGenerator
 from utils import sanitize_filename
 
@@ -19,6 +19,11 @@ ACTION_WEIGHTS = {"reply": 0.8, "forward": 0.1, "nothing": 0.1}
 DEFAULT_EARLY_END_CHANCE = 0.15
 DEFAULT_MAX_EMAILS_PER_THREAD = 9
 
+SUBJECT_DEDUP_SUFFIXES = [
+    "- Follow Up", "- Continued", "- Revisited",
+    "- Additional Thoughts", "- Part II",
+]
+
 
 class ThreadGenerator:
     """
@@ -49,7 +54,12 @@ class ThreadGenerator:
         self.emails = []  # Flat list of all emails generated
         self.threads = {}  # Map thread_id -> list of Email objects
         self._replied_parent_ids = set()  # Track messages that have been replied to
-        self._used_subjects = []  # Track subjects to avoid duplicates
+        self._message_ids = set()  # All stored message ids
+        # thread_id -> set of participant email addresses, maintained by
+        # _store_email so forward eligibility checks need no thread rescans
+        self._thread_participant_emails: dict[str, set[str]] = {}
+        self._emails_by_id: dict[str, Email] = {}  # message_id -> Email
+        self._used_subjects = set()  # Track subjects to avoid duplicates
         self.current_date = (
             start_date
             if start_date
@@ -68,6 +78,14 @@ class ThreadGenerator:
                 for _ in range(10)
             ]
         )
+        # Address -> roster entry index; reply_to/forward look people up by
+        # email on every generated message, so keep it O(1) instead of
+        # scanning the roster list each time.
+        self._roster_by_email = {p["email"]: p for p in self.roster}
+        # Pre-format display strings once; the same people are formatted on
+        # every email they send or receive.
+        for p in self.roster:
+            p["_display"] = f"{p['name']} <{p['email']}>"
         self.llm = llm
         self.file_gen = FileGenerator(output_dir, llm=llm, topic=topic)
         self.topic = topic
@@ -81,33 +99,23 @@ class ThreadGenerator:
         return self.current_date
 
     def get_person_display(self, person: dict) -> str:
-        """Format a person dict as 'Name <email>'."""
-        return f"{person['name']} <{person['email']}>"
-
-    def _get_thread_participants(self, thread_id: str) -> list[str]:
-        """Get all unique participants (senders and recipients) from a thread."""
-        participants = set()
-        if thread_id in self.threads:
-            for email in self.threads[thread_id]:
-                participants.add(email.sender)
-                participants.update(email.recipients)
-        return list(participants)
+        """Format a person dict as 'Name <email>', cached on the dict."""
+        display = person.get("_display")
+        if display is None:
+            display = person["_display"] = f"{person['name']} <{person['email']}>"
+        return display
 
     def _can_forward_to_new_recipients(self, thread_id: str) -> bool:
         """Check if there are roster members not in the current thread."""
-        return len(self._get_available_recipients(thread_id)) > 0
+        # any() stops at the first outsider rather than materializing the
+        # full available-recipient list just to test emptiness.
+        participants = self._thread_participant_emails.get(thread_id, frozenset())
+        return any(p["email"] not in participants for p in self.roster)
 
     def _get_available_recipients(self, thread_id: str) -> list[dict]:
         """Get roster members not yet in the thread - useful for branching."""
-        thread_participants = self._get_thread_participants(thread_id)
-        participant_emails = set()
-        for p in thread_participants:
-            if " <" in p:
-                participant_emails.add(p.split(" <")[1].rstrip(">"))
-            else:
-                participant_emails.add(p)
-
-        return [p for p in self.roster if p["email"] not in participant_emails]
+        participants = self._thread_participant_emails.get(thread_id, ())
+        return [p for p in self.roster if p["email"] not in participants]
 
     def _has_reply(self, message_id: str) -> bool:
         """Check if an email has already been replied to."""
@@ -126,7 +134,7 @@ class ThreadGenerator:
         if self.llm:
             subject, body = self.llm.generate_email(
                 sender, recipients, self.topic if self.topic else "General check-in",
-                used_subjects=self._used_subjects,
+                used_subjects=list(self._used_subjects),
             )
 
         if not body:
@@ -149,14 +157,11 @@ class ThreadGenerator:
 
         # Dedup fallback: if subject exactly matches an existing one, add suffix
         if subject and subject in self._used_subjects:
-            suffix = random.choice([
-                "- Follow Up", "- Continued", "- Revisited",
-                "- Additional Thoughts", "- Part II",
-            ])
+            suffix = random.choice(SUBJECT_DEDUP_SUFFIXES)
             subject = f"{subject} {suffix}"
 
         if subject:
-            self._used_subjects.append(subject)
+            self._used_subjects.add(subject)
 
         email = Email(
             sender=self.get_person_display(sender),
@@ -184,9 +189,7 @@ class ThreadGenerator:
         # Find the person in the roster that matches a recipient
         sender_info = random.choice(parent_recipients)
         # Try to find their full info in roster
-        roster_sender = next(
-            (p for p in self.roster if p["email"] == sender_info["email"]), None
-        )
+        roster_sender = self._roster_by_email.get(sender_info["email"])
         if not roster_sender:
             roster_sender = {
                 "name": sender_info["name"],
@@ -198,8 +201,7 @@ class ThreadGenerator:
         # Primary recipient is always the original sender
         recipients = [parent_sender]
         roster_recipients = [
-            next((p for p in self.roster if p["email"] == r["email"]), r)
-            for r in recipients
+            self._roster_by_email.get(r["email"], r) for r in recipients
         ]
 
         # Reply-all: CC other original recipients (excluding the new sender)
@@ -216,7 +218,10 @@ class ThreadGenerator:
         new_body = None
         if self.llm:
             _, new_body = self.llm.generate_email(
-                roster_sender, roster_recipients, self.topic, context=parent_email.body
+                roster_sender,
+                roster_recipients,
+                self.topic,
+                context=self.render_body(parent_email),
             )
 
         if not new_body:
@@ -224,13 +229,9 @@ class ThreadGenerator:
             if self.topic and random.random() < 0.2:
                 new_body += f"\n\nRegarding the {self.topic} aspect, I agree."
 
-        # Recursively quote the ENTIRE parent body, indented
-        parent_body_lines = parent_email.body.split("\n")
-        quoted_lines = [f"> {line}" for line in parent_body_lines]
-        quoted_block = "\n".join(quoted_lines)
-
-        full_body = f"{new_body}\n\nOn {parent_email.date.strftime('%Y-%m-%d %H:%M')}, {parent_email.sender} wrote:\n{quoted_block}"
-
+        # Only the new text is stored; the quoted parent chain is rendered
+        # lazily by render_body, so deep threads don't hold the same history
+        # once per reply.
         email = Email(
             sender=self.get_person_display(roster_sender),
             recipients=[
@@ -240,19 +241,20 @@ class ThreadGenerator:
                 for r in recipients
             ],
             subject=subject,
-            body=full_body,
+            body=None,
             date=self._tick_time(),
             message_id=None,
             parent_id=parent_email.message_id,
             thread_id=parent_email.thread_id,
             msg_type="reply",
         )
+        email.new_text = new_body
 
         # Add CC recipients for reply-all
-        email.cc = [f"{r['name']} <{r['email']}>" for r in cc_recipients]
+        email.cc = [self.get_person_display(r) for r in cc_recipients]
 
         # Handle Headers
-        email.references = parent_email.references + [parent_email.message_id]
+        email.references = parent_email.references + (parent_email.message_id,)
 
         self._store_email(email)
         return email
@@ -271,10 +273,11 @@ class ThreadGenerator:
         """
         
         # Pick sender from thread participants for realism
-        thread_participants = self._get_thread_participants(parent_email.thread_id)
+        participant_emails = self._thread_participant_emails.get(
+            parent_email.thread_id, set()
+        )
 
         # Find roster entries for participants
-        participant_emails = [parse_display(p)["email"] for p in thread_participants]
         roster_participants = [
             p for p in self.roster if p["email"] in participant_emails
         ]
@@ -286,9 +289,7 @@ class ThreadGenerator:
 
         # Forward to someone NOT in the original thread
         potential_recipients = [
-            p
-            for p in self.roster
-            if self.get_person_display(p) not in thread_participants
+            p for p in self.roster if p["email"] not in participant_emails
         ]
         if not potential_recipients:
             potential_recipients = [random.choice(self.roster)]
@@ -304,7 +305,7 @@ class ThreadGenerator:
                 sender,
                 recipients,
                 self.topic if self.topic else parent_email.subject,
-                context=parent_email.body,
+                context=self.render_body(parent_email),
                 is_forward=True,
             )
 
@@ -316,30 +317,29 @@ class ThreadGenerator:
                     + new_body
                 )
 
-        # Include the full parent body as quoted forwarded content
-        forward_block = f"---------- Forwarded message ----------\nFrom: {parent_email.sender}\nDate: {parent_email.date}\nSubject: {parent_email.subject}\nTo: {', '.join(parent_email.recipients)}\n\n{parent_email.body}"
-
-        full_body = f"{new_body}\n\n{forward_block}"
+        # The forwarded-message block is rendered lazily by render_body;
+        # only the forwarder's commentary is stored here.
 
         # IMPORTANT: Forward starts a NEW thread (new thread_id)
         # This is correct eDiscovery behavior since forwards introduce
         # new recipients and may spawn their own reply chains
-        new_thread_id = str(uuid.uuid4())
+        new_thread_id = next_id()
 
         email = Email(
             sender=self.get_person_display(sender),
             recipients=[self.get_person_display(r) for r in recipients],
             subject=subject,
-            body=full_body,
+            body=None,
             date=self._tick_time(),
             message_id=None,
             parent_id=parent_email.message_id,  # Still references parent for traceability
             thread_id=new_thread_id,  # NEW thread
             msg_type="forward",
         )
+        email.new_text = new_body
 
         # Keep references chain for full traceability back to original
-        email.references = parent_email.references + [parent_email.message_id]
+        email.references = parent_email.references + (parent_email.message_id,)
 
         # Carry over attachments from parent
         for att in parent_email.attachments:
@@ -348,21 +348,61 @@ class ThreadGenerator:
         self._store_email(email)
         return email
 
+    def render_body(self, email: Email) -> str:
+        """
+        Materialize the full body of an email, including its quoted chain.
+
+        Replies and forwards store only their new text (Email.new_text);
+        the quoted history is reconstructed here by walking parent_id links.
+        Storing the chain by reference keeps memory linear in thread depth
+        instead of quadratic, since each reply no longer embeds a private
+        copy of its entire ancestry.
+        """
+        new_text = email.new_text
+        if new_text is None:
+            return email.body
+        parent = (
+            self._emails_by_id.get(email.parent_id) if email.parent_id else None
+        )
+        if parent is None:
+            return new_text
+        parent_body = self.render_body(parent)
+        if email.type == "forward":
+            forward_block = f"---------- Forwarded message ----------\nFrom: {parent.sender}\nDate: {parent.date}\nSubject: {parent.subject}\nTo: {', '.join(parent.recipients)}\n\n{parent_body}"
+            return f"{new_text}\n\n{forward_block}"
+        # Quote the ENTIRE parent body, indented; a single str.replace keeps
+        # this one C-level pass instead of formatting every line separately
+        quoted_block = "> " + parent_body.replace("\n", "\n> ")
+        return f"{new_text}\n\nOn {parent.date.strftime('%Y-%m-%d %H:%M')}, {parent.sender} wrote:\n{quoted_block}"
+
     def _store_email(self, email: Email) -> None:
         """Store an email and update thread tracking."""
         self.emails.append(email)
+        self._emails_by_id[email.message_id] = email
+        self._message_ids.add(email.message_id)
         if email.thread_id not in self.threads:
             self.threads[email.thread_id] = []
         self.threads[email.thread_id].append(email)
 
+        participants = self._thread_participant_emails.setdefault(
+            email.thread_id, set()
+        )
+        participants.add(parse_display(email.sender)["email"])
+        participants.update(parse_display(r)["email"] for r in email.recipients)
+
         # Track that the parent has been replied to (prevents branching)
         if email.parent_id:
             self._replied_parent_ids.add(email.parent_id)
 
-        inclusive_count = self._count_inclusive_emails()
-        logging.info(
-            f"  [Progress] Total emails: {len(self.emails)} | Inclusive emails: {inclusive_count}"
-        )
+        # Progress every 25 emails, with %-formatting deferred to the
+        # logging framework so filtered-out records cost nothing.
+        total = len(self.emails)
+        if total % 25 == 0 and logging.getLogger().isEnabledFor(logging.INFO):
+            logging.info(
+                "  [Progress] Total emails: %d | Inclusive emails: %d",
+                total,
+                self._count_inclusive_emails(),
+            )
 
     def _count_inclusive_emails(self) -> int:
         """
@@ -380,12 +420,13 @@ class ThreadGenerator:
             └── D (reply to A) <- INCLUSIVE (no replies)
         
         This thread has 2 inclusive emails: C and D.
+
+        Every parent id belongs to a stored email, so the count is exactly
+        the stored messages minus the ones something replied to. Both sets
+        are maintained by _store_email, making this an O(1) read for
+        simulate() and the per-store progress log.
         """
-        parent_message_ids = set()
-        for email_obj in self.emails:
-            if email_obj.parent_id:
-                parent_message_ids.add(email_obj.parent_id)
-        return sum(1 for e in self.emails if e.message_id not in parent_message_ids)
+        return len(self._message_ids) - len(self._replied_parent_ids)
 
     def simulate(
         self,
@@ -398,10 +439,10 @@ class ThreadGenerator:
 
         while self._count_inclusive_emails() < target_inclusive:
             # Create a new thread with a root email
-            self.create_root_email()
+            root = self.create_root_email()
 
             # Get the thread we just created
-            tid = list(self.threads.keys())[-1]
+            tid = root.thread_id
             thread_msgs = self.threads[tid]
 
             # Determine this thread's target length
@@ -443,8 +484,124 @@ class ThreadGenerator:
         
         logging.info("Simulation complete.")
 
+    def simulate_parallel(
+        self,
+        target_inclusive: int = 5,
+        max_emails_per_thread: int = DEFAULT_MAX_EMAILS_PER_THREAD,
+        early_end_chance: float = DEFAULT_EARLY_END_CHANCE,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """
+        Run the simulation sharded across worker processes.
+
+        Threads are independent of each other (disjoint thread_ids and
+        message_ids), so the inclusive target is split into per-worker shards
+        that each run the serial simulate() and ship their emails back.
+        Subject de-duplication is the only cross-shard coupling: each shard
+        gets a snapshot of the used subjects, and collisions that slip
+        through between shards are reconciled on merge with the usual
+        suffix renaming.
+
+        Requires llm=None: LLM client objects are not picklable and their
+        network latency, not CPU, dominates when they are in play - use
+        simulate() in that case.
+        """
+        if self.llm is not None:
+            raise ValueError("simulate_parallel requires llm=None; use simulate()")
+
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        shards = min(max_workers, target_inclusive)
+        if shards <= 1:
+            self.simulate(target_inclusive, max_emails_per_thread, early_end_chance)
+            return
+
+        base, extra = divmod(target_inclusive, shards)
+        targets = [base + (1 if i < extra else 0) for i in range(shards)]
+        # Forked children inherit the parent's RNG state; hand each shard its
+        # own seed (drawn here so FAKER_SEED still controls the sequence).
+        seeds = [random.randrange(2**32) for _ in targets]
+        used_snapshot = list(self._used_subjects)
+
+        logging.info(
+            "Simulation started. Target: %d inclusive emails across %d workers.",
+            target_inclusive, shards,
+        )
+        with concurrent.futures.ProcessPoolExecutor(max_workers=shards) as pool:
+            futures = [
+                pool.submit(
+                    _simulate_shard,
+                    target, seed, self.roster, self.current_date,
+                    self.file_gen.output_dir, self.topic,
+                    round(self.attachment_percent * 100), self.action_weights,
+                    used_snapshot, max_emails_per_thread, early_end_chance,
+                )
+                for target, seed in zip(targets, seeds)
+            ]
+            # Merge in submission order so runs are as repeatable as the
+            # serial path allows.
+            for future in futures:
+                self._merge_shard(future.result())
+        logging.info("Simulation complete.")
 
-def save_as_markdown(email_obj: Email, output_dir: str = "output", index: int = 0) -> str:
+    def _merge_shard(self, emails: list[Email]) -> None:
+        """Fold one worker's emails into this generator's state."""
+        renames: dict[str, str] = {}
+        for email in emails:
+            if email.type == "new":
+                subject = email.subject
+                if subject and subject in self._used_subjects:
+                    renames[subject] = f"{subject} {random.choice(SUBJECT_DEDUP_SUFFIXES)}"
+                subject = renames.get(subject, subject)
+                if subject:
+                    self._used_subjects.add(subject)
+            # Replies/forwards carry the root subject behind Re:/Fwd:
+            # prefixes, so a renamed root is propagated by substring.
+            for original, renamed in renames.items():
+                if original in email.subject:
+                    email.subject = email.subject.replace(original, renamed)
+                    break
+            self._store_email(email)
+            if email.date > self.current_date:
+                self.current_date = email.date
+
+
+def _simulate_shard(
+    target_inclusive: int,
+    seed: int,
+    roster: list[dict],
+    start_date: datetime.datetime,
+    output_dir: str,
+    topic: Optional[str],
+    attachment_percent: int,
+    action_weights: dict,
+    used_subjects: list[str],
+    max_emails_per_thread: int,
+    early_end_chance: float,
+) -> list[Email]:
+    """Worker for simulate_parallel: run one serial shard in a child process."""
+    random.seed(seed)
+    fake.seed_instance(seed)
+    gen = ThreadGenerator(
+        roster=roster,
+        llm=None,
+        start_date=start_date,
+        output_dir=output_dir,
+        topic=topic,
+        attachment_percent=attachment_percent,
+        action_weights=action_weights,
+    )
+    gen._used_subjects.update(used_subjects)
+    gen.simulate(target_inclusive, max_emails_per_thread, early_end_chance)
+    return gen.emails
+
+
+def save_as_markdown(
+    email_obj: Email,
+    output_dir: str = "output",
+    index: int = 0,
+    body: Optional[str] = None,
+) -> str:
     """
     Save an email as a markdown file with proper naming for sort order.
 
@@ -455,6 +612,9 @@ def save_as_markdown(email_obj: Email, output_dir: str = "output", index: int =
         email_obj: Email object to save
         output_dir: Directory to write files to
         index: Numeric index for file ordering
+        body: Pre-rendered body text; pass ThreadGenerator.render_body(email)
+            for replies/forwards, whose quoted chain is materialized lazily.
+            Defaults to email_obj.body.
 
     Returns:
         Path to the saved markdown file
@@ -478,24 +638,36 @@ def save_as_markdown(email_obj: Email, output_dir: str = "output", index: int =
             new_att_path = os.path.join(output_dir, new_att_name)
 
             if not os.path.exists(new_att_path) and os.path.exists(att.filepath):
-                shutil.copy(att.filepath, new_att_path)
+                # Attachments are never mutated after creation, so a
+                # hardlink aliases the bytes without copying them; fall back
+                # to a real copy on filesystems that refuse the link.
+                try:
+                    os.link(att.filepath, new_att_path)
+                except OSError:
+                    shutil.copy(att.filepath, new_att_path)
 
             att_list.append(new_att_name)
         else:
             att_list.append(att.filename)
 
+    # Assemble the whole document and write it in one call rather than one
+    # buffered write per header line.
+    parts = [
+        f"**From:** {email_obj.sender}\n",
+        f"**Date:** {email_obj.date.strftime('%A, %B %d, %Y %I:%M %p')}\n",
+        f"**To:** {', '.join(email_obj.recipients)}\n",
+    ]
+    if email_obj.cc:
+        parts.append(f"**Cc:** {', '.join(email_obj.cc)}\n")
+    parts.append(f"**Subject:** {email_obj.subject}\n")
+
+    if att_list:
+        parts.append(f"**Attachments:** {', '.join(att_list)}\n")
+
+    parts.append("\n---\n\n")
+    parts.append(body if body is not None else email_obj.body)
+
     with open(filepath, "w", encoding="utf-8") as f:
-        f.write(f"**From:** {email_obj.sender}\n")
-        f.write(f"**Date:** {email_obj.date.strftime('%A, %B %d, %Y %I:%M %p')}\n")
-        f.write(f"**To:** {', '.join(email_obj.recipients)}\n")
-        if email_obj.cc:
-            f.write(f"**Cc:** {', '.join(email_obj.cc)}\n")
-        f.write(f"**Subject:** {email_obj.subject}\n")
-
-        if att_list:
-            f.write(f"**Attachments:** {', '.join(att_list)}\n")
-
-        f.write("\n---\n\n")
-        f.write(email_obj.body)
+        f.write("".join(parts))
 
     return filepath
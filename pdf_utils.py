@@ -1,43 +1,61 @@
+import functools
 import logging
 import os
 from fpdf import FPDF
 
-def init_pdf(base_dir=None):
+
+@functools.lru_cache(maxsize=None)
+def _resolve_font_path(base_dir):
+    """Locate DejaVuSans.ttf under base_dir, or None if it is missing.
+
+    Memoized so repeated init_pdf calls skip the path join and stat; the
+    warning for a missing font is likewise emitted once per location
+    instead of once per document.
+    """
+    font_path = os.path.join(base_dir, "fonts", "DejaVuSans.ttf")
+    if os.path.exists(font_path):
+        return font_path
+    logging.warning(f"Font not found at {font_path}, falling back to standard fonts.")
+    return None
+
+
+def init_pdf(base_dir=None, styles=("", "B", "I", "BI")):
     """
     Initialize an FPDF object with DejaVu fonts registered for Unicode support.
-    
+
+    Each registered style re-parses the TTF file and rebuilds its font tables,
+    which dominates the cost of creating small documents. Callers that only
+    use a subset of styles (e.g. body text only) should pass `styles` to skip
+    the unused registrations. Font objects cannot be cached across documents:
+    fpdf subsets and closes them in place during output().
+
     Args:
-        base_dir: Optional base directory to look for fonts folder. 
+        base_dir: Optional base directory to look for fonts folder.
                   If None, tries to determine from this file's location.
-    
+        styles: Font style variants to register ("", "B", "I", "BI").
+
     Returns:
         An initialized FPDF instance.
     """
     if base_dir is None:
         base_dir = os.path.dirname(os.path.abspath(__file__))
-        
-    font_path = os.path.join(base_dir, "fonts", "DejaVuSans.ttf")
-    
+
+    font_path = _resolve_font_path(base_dir)
+
     pdf = FPDF()
-    
-    if os.path.exists(font_path):
+
+    if font_path:
         # Register variants
-        # Note: uni=True is deprecated in newer fpdf2 versions but kept for compatibility 
+        # Note: uni=True is deprecated in newer fpdf2 versions but kept for compatibility
         # with what might be installed. If it warns, we can remove it.
         # Check fpdf version if possible or try/except, but sticking to existing pattern for now.
         try:
-            pdf.add_font("DejaVu", "", font_path, uni=True)
-            pdf.add_font("DejaVu", "B", font_path, uni=True)
-            pdf.add_font("DejaVu", "I", font_path, uni=True)
-            pdf.add_font("DejaVu", "BI", font_path, uni=True)
+            for style in styles:
+                pdf.add_font("DejaVu", style, font_path, uni=True)
         except TypeError:
              # Fallback for newer fpdf2 that removed 'uni' arg
-            pdf.add_font("DejaVu", "", font_path)
-            pdf.add_font("DejaVu", "B", font_path)
-            pdf.add_font("DejaVu", "I", font_path)
-            pdf.add_font("DejaVu", "BI", font_path)
-    else:
-        logging.warning(f"Font not found at {font_path}, falling back to standard fonts.")
+            for style in styles:
+                pdf.add_font("DejaVu", style, font_path)
         
     # Set default settings
     pdf.set_margins(10, 10, 10)
@@ -6,6 +6,21 @@ from typing import Optional
 
 from faker_instance import fake
 
+DEPARTMENTS = ["Engineering", "Marketing", "Sales", "Human Resources", "Finance", "Legal", "Product"]
+TITLES = {
+    "Engineering": ["Software Engineer", "Senior Software Engineer", "Engineering Manager", "CTO", "DevOps Engineer"],
+    "Marketing": ["Marketing Specialist", "Marketing Manager", "CMO", "Content Creator"],
+    "Sales": ["Sales Representative", "Account Manager", "VP of Sales"],
+    "Human Resources": ["HR Generalist", "HR Manager", "Recruiter"],
+    "Finance": ["Accountant", "Finance Director", "CFO"],
+    "Legal": ["General Counsel", "Legal Assistant"],
+    "Product": ["Product Manager", "Director of Product", "UX Designer"]
+}
+
+# Flattened (department, title) pairs so each employee needs one draw
+# instead of a department draw followed by a title draw.
+_DEPT_TITLE_PAIRS = [(dept, title) for dept in DEPARTMENTS for title in TITLES[dept]]
+
 
 class RosterGenerator:
     def __init__(self, company_name: Optional[str] = None) -> None:
@@ -14,32 +29,23 @@ class RosterGenerator:
         self.employees = []
 
     def generate_roster(self, count: int = 20) -> list[dict]:
-        self.employees = []
-        departments = ["Engineering", "Marketing", "Sales", "Human Resources", "Finance", "Legal", "Product"]
-        titles = {
-            "Engineering": ["Software Engineer", "Senior Software Engineer", "Engineering Manager", "CTO", "DevOps Engineer"],
-            "Marketing": ["Marketing Specialist", "Marketing Manager", "CMO", "Content Creator"],
-            "Sales": ["Sales Representative", "Account Manager", "VP of Sales"],
-            "Human Resources": ["HR Generalist", "HR Manager", "Recruiter"],
-            "Finance": ["Accountant", "Finance Director", "CFO"],
-            "Legal": ["General Counsel", "Legal Assistant"],
-            "Product": ["Product Manager", "Director of Product", "UX Designer"]
-        }
+        # Batch the Faker draws and department/title picks up front; each
+        # fake.* access goes through the provider-lookup proxy, so pulling
+        # them in bulk keeps the per-employee loop to plain formatting.
+        first_names = [fake.first_name() for _ in range(count)]
+        last_names = [fake.last_name() for _ in range(count)]
+        dept_titles = random.choices(_DEPT_TITLE_PAIRS, k=count)
+        domain = self.domain
 
-        for _ in range(count):
-            first_name = fake.first_name()
-            last_name = fake.last_name()
-            name = f"{first_name} {last_name}"
-            email = f"{first_name.lower()}.{last_name.lower()}@{self.domain}"
-            dept = random.choice(departments)
-            title = random.choice(titles[dept])
-            
-            self.employees.append({
-                "name": name,
-                "email": email,
+        self.employees = [
+            {
+                "name": f"{first} {last}",
+                "email": f"{first.lower()}.{last.lower()}@{domain}",
                 "department": dept,
-                "title": title
-            })
+                "title": title,
+            }
+            for first, last, (dept, title) in zip(first_names, last_names, dept_titles)
+        ]
         return self.employees
 
     def save_roster(self, filepath: str = "roster.json") -> None:
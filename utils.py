@@ -2,6 +2,15 @@
 
 import re
 
+# Word characters (alphanumerics and underscore) pass through; everything
+# else becomes an underscore. Compiled once so each call is a single C-level
+# substitution instead of a per-character Python loop.
+_SANITIZE_RE = re.compile(r"[^\w]")
+
+# Leading "* " list markers, compiled once rather than re-parsed inside
+# strip_markdown on every call.
+_BULLET_RE = re.compile(r"^\* ", re.MULTILINE)
+
 
 def sanitize_filename(text: str, max_length: int | None = None) -> str:
     """Replace non-alphanumeric characters with underscores.
@@ -13,7 +22,7 @@ def sanitize_filename(text: str, max_length: int | None = None) -> str:
     Returns:
         A filesystem-safe string.
     """
-    cleaned = "".join(c if c.isalnum() or c == "_" else "_" for c in text)
+    cleaned = _SANITIZE_RE.sub("_", text)
     if max_length is not None:
         cleaned = cleaned[:max_length]
     return cleaned
@@ -31,5 +40,5 @@ def strip_markdown(text: str) -> str:
         Cleaned plain-text string.
     """
     text = text.replace("**", "")
-    text = re.sub(r"^\* ", "\u2022 ", text, flags=re.MULTILINE)
+    text = _BULLET_RE.sub("\u2022 ", text)
     return text